@@ -1,9 +1,26 @@
+import functools
 import math
 import zipfile
-import xml.etree.ElementTree as ET
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
+
+try:
+    from lxml import etree as ET
+
+    _HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+    _HAS_LXML = False
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
 XLSX_PATH = Path("je_samples.xlsx")
 OUTPUT_DIR = Path("output")
 REPORT_PATH = OUTPUT_DIR / "benford_report.md"
@@ -12,145 +29,315 @@ DEVIATION_SVG = OUTPUT_DIR / "first_digit_deviation.svg"
 
 NS = {"a": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
 
+# Clark-notation tags, so lookups and tag checks skip namespace-prefix parsing.
+_A = f"{{{NS['a']}}}"
+_TAG_SI, _TAG_T, _TAG_R, _TAG_C, _TAG_V, _TAG_ROW = (
+    _A + name for name in ("si", "t", "r", "c", "v", "row")
+)
+_TAG_R_T = f"{_TAG_R}/{_TAG_T}"
+
+_DIGITS = np.arange(1, 10)
+_EXPECTED_PCT = np.log10(1.0 + 1.0 / _DIGITS)
+# Shared by every BenfordResult, so guard it against in-place edits.
+_EXPECTED_PCT.flags.writeable = False
+
+# Powers of ten for mapping a binary exponent to its decade; values small
+# enough to need entries below 1e-300 are rescaled first.
+_POW10_MIN = -300
+_POW10 = np.array([10.0**k for k in range(_POW10_MIN, 309)])
+
+# Below this many amounts, the serial kernel is at least as fast.
+_PARALLEL_MIN_SIZE = 100_000
+
+# Fixed number of private histograms for the parallel kernel. Unlike
+# get_num_threads(), a constant lets Numba cache the compiled kernel.
+_PARALLEL_CHUNKS = 64
+
+# Raw amounts buffered before each bulk parse-and-count when streaming.
+_STREAM_CHUNK_SIZE = 1 << 18
+
 
 @dataclass
 class BenfordResult:
-    counts: dict
+    counts: np.ndarray
     total: int
-    observed_pct: dict
-    expected_pct: dict
+    observed_pct: np.ndarray
+    expected_pct: np.ndarray
     mad: float
     chi_square: float
 
 
-def _load_shared_strings(zip_file: zipfile.ZipFile) -> list[str]:
-    shared = ET.fromstring(zip_file.read("xl/sharedStrings.xml"))
-    strings = []
-    for si in shared.findall("a:si", NS):
-        text_node = si.find("a:t", NS)
-        if text_node is not None:
-            strings.append(text_node.text or "")
-        else:
-            runs = si.findall("a:r/a:t", NS)
-            strings.append("".join(run.text or "" for run in runs))
+def _iterparse_elements(
+    source, tag: str
+) -> Iterator[tuple[ET.Element, ET.Element]]:
+    # Yields (parent, element) for each completed ``tag`` element, then drops
+    # it from the tree so memory stays flat for large parts.
+    if _HAS_LXML:
+        for _, elem in ET.iterparse(source, events=("end",), tag=tag):
+            parent = elem.getparent()
+            yield parent, elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
+        return
+    stack = []
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            stack.append(elem)
+            continue
+        stack.pop()
+        if elem.tag == tag:
+            yield stack[-1], elem
+            stack[-1].remove(elem)
+
+
+def _load_shared_strings(
+    zip_file: zipfile.ZipFile, entries: dict[str, zipfile.ZipInfo]
+) -> list[str]:
+    info = entries.get("xl/sharedStrings.xml")
+    if info is None:
+        return []
+    shared_file = zip_file.open(info)
+    strings = None
+    index = 0
+    with shared_file:
+        for shared, elem in _iterparse_elements(shared_file, _TAG_SI):
+            if strings is None:
+                unique_count = shared.attrib.get("uniqueCount")
+                strings = [None] * int(unique_count) if unique_count else []
+            text_node = elem.find(_TAG_T)
+            if text_node is not None:
+                text = text_node.text or ""
+            else:
+                runs = elem.findall(_TAG_R_T)
+                text = "".join(run.text or "" for run in runs)
+            if index < len(strings):
+                strings[index] = text
+            else:
+                strings.append(text)
+            index += 1
+    if strings is None:
+        return []
+    del strings[index:]
     return strings
 
 
-def _column_headers(sheet_root: ET.Element, strings: list[str]) -> dict[str, str]:
+def _column_headers(
+    row1: ET.Element, shared_strings: Callable[[], list[str]]
+) -> dict[str, str]:
     headers = {}
-    row1 = sheet_root.find(".//a:sheetData/a:row", NS)
-    if row1 is None:
-        return headers
-    for cell in row1.findall("a:c", NS):
-        cell_ref = cell.attrib.get("r", "")
-        col = "".join(ch for ch in cell_ref if ch.isalpha())
-        value_node = cell.find("a:v", NS)
-        if value_node is None:
+    for cell in row1.findall(_TAG_C):
+        cell_ref = cell.get("r", "")
+        col = cell_ref.rstrip("0123456789")
+        raw = _cell_value(cell, shared_strings)
+        if raw is None:
             continue
-        if cell.attrib.get("t") == "s":
-            headers[col] = strings[int(value_node.text)]
-        else:
-            headers[col] = value_node.text or ""
+        headers[col] = raw or ""
     return headers
 
 
-def _cell_value(cell: ET.Element, strings: list[str]) -> str | None:
-    value_node = cell.find("a:v", NS)
-    if value_node is None:
+def _cell_value(
+    cell: ET.Element, shared_strings: Callable[[], list[str]]
+) -> str | None:
+    cell_type = cell.get("t")
+    # A cell's only child is usually its <v>, so scan children directly
+    # instead of running a path lookup.
+    for value_node in cell:
+        if value_node.tag == _TAG_V:
+            break
+    else:
         return None
-    if cell.attrib.get("t") == "s":
-        return strings[int(value_node.text)]
+    if cell_type == "s":
+        return shared_strings()[int(value_node.text)]
     return value_node.text
 
 
-def _first_digit(value: float) -> int | None:
-    if value == 0:
-        return None
-    value = abs(value)
-    text = f"{value:.12g}"
-    text = text.lstrip("0").lstrip(".")
-    for char in text:
-        if char.isdigit() and char != "0":
-            return int(char)
-    return None
-
-
-def _benford_expected() -> dict[int, float]:
-    return {digit: math.log10(1 + 1 / digit) for digit in range(1, 10)}
-
-
-def analyze_first_digits(values: list[float]) -> BenfordResult:
-    counts = {digit: 0 for digit in range(1, 10)}
-    total = 0
-    for value in values:
-        digit = _first_digit(value)
-        if digit is None:
-            continue
-        counts[digit] += 1
-        total += 1
-    expected_pct = _benford_expected()
-    observed_pct = {
-        digit: (counts[digit] / total if total else 0.0) for digit in counts
-    }
-    mad = sum(abs(observed_pct[d] - expected_pct[d]) for d in counts) / 9
-    chi_square = sum(
-        ((counts[d] - total * expected_pct[d]) ** 2) / (total * expected_pct[d])
-        for d in counts
-        if total * expected_pct[d] > 0
+def _count_first_digits_numpy(a: np.ndarray) -> np.ndarray:
+    a = np.abs(a)
+    a = a[(a != 0) & np.isfinite(a)]
+    exponent = np.floor(np.log10(a))
+    # Scale in two steps so 10**exponent never drops into the subnormal range.
+    head = np.maximum(exponent, -300.0)
+    mantissa = a / np.power(10.0, head) / np.power(10.0, exponent - head)
+    # Round to 12 significant digits so float noise such as
+    # 2.9999999999999996 still lands on the intended leading digit.
+    mantissa = np.round(mantissa, 11)
+    first = mantissa.astype(np.int64)
+    first[first >= 10] = 1
+    return np.bincount(first, minlength=10)
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _leading_digit(v):
+        # Returns 0 for values without a leading digit (zero, inf, NaN).
+        v = abs(v)
+        if v == 0.0 or not math.isfinite(v):
+            return 0
+        if v < 1e-290:
+            v *= 1e300
+        # floor(log10(v)) is floor((e2 - 1) * log10(2)) or one more; the
+        # multiply-shift is exact for every double exponent.
+        _, e2 = math.frexp(v)
+        exponent = ((e2 - 1) * 78913) >> 18
+        if v >= _POW10[exponent + 1 - _POW10_MIN]:
+            exponent += 1
+        mantissa = v / _POW10[exponent - _POW10_MIN]
+        digit = int(np.round(mantissa, 11))
+        return 1 if digit >= 10 else digit
+
+    @njit(cache=True)
+    def _count_first_digits_serial(a):
+        counts = np.zeros(10, np.int64)
+        for i in range(a.shape[0]):
+            counts[_leading_digit(a[i])] += 1
+        return counts
+
+    @njit(parallel=True, cache=True)
+    def _count_first_digits_parallel(a):
+        # One private histogram per chunk avoids contended increments.
+        n = a.shape[0]
+        n_chunks = _PARALLEL_CHUNKS
+        chunk = (n + n_chunks - 1) // n_chunks
+        local = np.zeros((n_chunks, 10), np.int64)
+        for c in prange(n_chunks):
+            for i in range(c * chunk, min((c + 1) * chunk, n)):
+                local[c, _leading_digit(a[i])] += 1
+        return local.sum(axis=0)
+
+    def _count_first_digits(a: np.ndarray) -> np.ndarray:
+        if a.shape[0] < _PARALLEL_MIN_SIZE:
+            return _count_first_digits_serial(a)
+        return _count_first_digits_parallel(a)
+
+else:
+    _count_first_digits = _count_first_digits_numpy
+
+
+def analyze_first_digits(values: np.ndarray) -> BenfordResult:
+    a = np.ascontiguousarray(values, dtype=np.float64)
+    return _benford_result(_count_first_digits(a)[1:10])
+
+
+def _benford_result(counts_arr: np.ndarray) -> BenfordResult:
+    total = int(counts_arr.sum())
+    observed = counts_arr / total if total else np.zeros(9)
+    mad = float(np.mean(np.abs(observed - _EXPECTED_PCT)))
+    expected_counts = total * _EXPECTED_PCT
+    chi_square = (
+        float(np.sum((counts_arr - expected_counts) ** 2 / expected_counts))
+        if total
+        else 0.0
     )
     return BenfordResult(
-        counts=counts,
+        counts=counts_arr,
         total=total,
-        observed_pct=observed_pct,
-        expected_pct=expected_pct,
+        observed_pct=observed,
+        expected_pct=_EXPECTED_PCT,
         mad=mad,
         chi_square=chi_square,
     )
 
 
-def _read_amounts() -> list[float]:
+def _amount_columns(headers: dict[str, str]) -> tuple[str | None, str | None]:
+    column_for_abs = None
+    column_for_amount = None
+    for col, header in headers.items():
+        if header == "AbsoluteAmount":
+            column_for_abs = col
+        elif header == "Amount":
+            column_for_amount = col
+    if column_for_abs is None and column_for_amount is None:
+        raise ValueError("No amount column found in spreadsheet")
+    return column_for_abs, column_for_amount
+
+
+def _iter_raw_amounts() -> Iterator[str]:
     with zipfile.ZipFile(XLSX_PATH) as zip_file:
-        strings = _load_shared_strings(zip_file)
-        sheet_root = ET.fromstring(zip_file.read("xl/worksheets/sheet1.xml"))
-        headers = _column_headers(sheet_root, strings)
-        column_for_abs = None
-        column_for_amount = None
-        for col, header in headers.items():
-            if header == "AbsoluteAmount":
-                column_for_abs = col
-            elif header == "Amount":
-                column_for_amount = col
-        if column_for_abs is None and column_for_amount is None:
+        entries = {info.filename: info for info in zip_file.infolist()}
+        # Amount columns are numeric, so sharedStrings is only parsed if a
+        # string cell is actually looked up.
+        shared_strings = functools.cache(
+            lambda: _load_shared_strings(zip_file, entries)
+        )
+        columns = None
+        with zip_file.open(entries["xl/worksheets/sheet1.xml"]) as sheet_file:
+            for _, row in _iterparse_elements(sheet_file, _TAG_ROW):
+                if columns is None:
+                    columns = _amount_columns(_column_headers(row, shared_strings))
+                    continue
+                column_for_abs, column_for_amount = columns
+                raw_abs = None
+                raw_amount = None
+                for cell in row:
+                    col = cell.get("r", "").rstrip("0123456789")
+                    if col != column_for_abs and col != column_for_amount:
+                        continue
+                    raw = _cell_value(cell, shared_strings)
+                    if col == column_for_abs:
+                        raw_abs = raw
+                    else:
+                        raw_amount = raw
+                if raw_abs not in (None, ""):
+                    yield raw_abs
+                elif raw_amount not in (None, ""):
+                    yield raw_amount
+        if columns is None:
             raise ValueError("No amount column found in spreadsheet")
 
-        values = []
-        for row in sheet_root.findall(".//a:sheetData/a:row", NS)[1:]:
-            cells = {cell.attrib.get("r", ""): cell for cell in row.findall("a:c", NS)}
-            amount = None
-            if column_for_abs:
-                cell = cells.get(f"{column_for_abs}{row.attrib.get('r')}")
-                if cell is not None:
-                    raw = _cell_value(cell, strings)
-                    if raw not in (None, ""):
-                        amount = float(raw)
-            if amount is None and column_for_amount:
-                cell = cells.get(f"{column_for_amount}{row.attrib.get('r')}")
-                if cell is not None:
-                    raw = _cell_value(cell, strings)
-                    if raw not in (None, ""):
-                        amount = float(raw)
-            if amount is None:
-                continue
-            if amount == 0:
-                continue
-            values.append(amount)
-        return values
+
+def _stream_amounts_into_counts() -> np.ndarray:
+    counts = np.zeros(10, np.int64)
+    raws = []
+    for raw in _iter_raw_amounts():
+        raws.append(raw)
+        if len(raws) == _STREAM_CHUNK_SIZE:
+            counts += _count_first_digits(np.array(raws, dtype=np.float64))
+            raws.clear()
+    counts += _count_first_digits(np.array(raws, dtype=np.float64))
+    return counts[1:]
+
+
+def _svg_open(width: int, height: int, margin: int, title: str) -> str:
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}">\n'
+        f'<rect width="100%" height="100%" fill="#ffffff"/>\n'
+        f'<text x="{width//2}" y="30" font-size="18" text-anchor="middle">{title}</text>\n'
+        f'<line x1="{margin}" y1="{height-margin}" x2="{width-margin}" y2="{height-margin}" stroke="#333"/>\n'
+        f'<line x1="{margin}" y1="{margin}" x2="{margin}" y2="{height-margin}" stroke="#333"/>\n'
+    )
+
+
+def _svg_digit_labels(x_positions: list[float], y: float) -> str:
+    labels = "".join(
+        f'<text x="{round(x)}" y="{y}">{digit}</text>\n'
+        for digit, x in enumerate(x_positions, start=1)
+    )
+    return f'<g font-size="12" text-anchor="middle">\n{labels}</g>\n'
+
+
+def _svg_y_grid(
+    y_ticks: list[tuple[float, float]], x_start: float, x_end: float
+) -> str:
+    grid = "".join(
+        f'<line x1="{x_start}" y1="{round(y)}" x2="{x_end}" y2="{round(y)}"/>\n'
+        for y, _ in y_ticks
+    )
+    labels = "".join(
+        f'<text x="{x_start-10}" y="{round(y)+4}">{val:.1f}%</text>\n'
+        for y, val in y_ticks
+    )
+    return (
+        f'<g stroke="#ddd">\n{grid}</g>\n'
+        f'<g font-size="10" text-anchor="end">\n{labels}</g>\n'
+    )
 
 
 def _svg_bar_chart(
     path: Path,
     title: str,
-    series: dict[str, dict[int, float]],
+    series: dict[str, np.ndarray],
     y_label: str,
     y_max: float,
 ):
@@ -166,112 +353,92 @@ def _svg_bar_chart(
     def y_pos(value: float) -> float:
         return height - margin - (value / y_max) * chart_height
 
-    lines = [
-        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}">',
-        f'<rect width="100%" height="100%" fill="#ffffff"/>',
-        f'<text x="{width/2}" y="30" font-size="18" text-anchor="middle">{title}</text>',
-        f'<line x1="{margin}" y1="{height-margin}" x2="{width-margin}" y2="{height-margin}" stroke="#333"/>',
-        f'<line x1="{margin}" y1="{margin}" x2="{margin}" y2="{height-margin}" stroke="#333"/>',
-    ]
-
     colors = ["#4c78a8", "#f58518", "#54a24b"]
     series_items = list(series.items())
 
-    for idx, digit in enumerate(digits):
-        x_base = margin + idx * group_width
-        for s_idx, (name, values) in enumerate(series_items):
-            value = values[digit]
-            x = x_base + (s_idx + 0.5) * bar_width
-            y = y_pos(value)
-            bar_height = height - margin - y
-            lines.append(
-                f'<rect x="{x:.2f}" y="{y:.2f}" width="{bar_width*0.8:.2f}" height="{bar_height:.2f}" fill="{colors[s_idx % len(colors)]}"/>'
+    with path.open("w", encoding="utf-8", buffering=1 << 16) as fh:
+        fh.write(_svg_open(width, height, margin, title))
+
+        for idx in range(len(digits)):
+            x_base = margin + idx * group_width
+            for s_idx, (name, values) in enumerate(series_items):
+                value = values[idx]
+                x = round(x_base + (s_idx + 0.5) * bar_width)
+                y = round(y_pos(value))
+                bar_height = height - margin - y
+                fh.write(
+                    f'<rect x="{x}" y="{y}" width="{round(bar_width*0.8)}" height="{bar_height}" fill="{colors[s_idx % len(colors)]}"/>\n'
+                )
+        fh.write(
+            _svg_digit_labels(
+                [margin + (idx + 0.5) * group_width for idx in range(len(digits))],
+                height - margin + 20,
             )
-        lines.append(
-            f'<text x="{x_base + group_width/2}" y="{height-margin+20}" font-size="12" text-anchor="middle">{digit}</text>'
         )
 
-    for i in range(6):
-        val = y_max * i / 5
-        y = y_pos(val)
-        lines.append(
-            f'<line x1="{margin}" y1="{y:.2f}" x2="{width-margin}" y2="{y:.2f}" stroke="#ddd"/>'
-        )
-        lines.append(
-            f'<text x="{margin-10}" y="{y+4:.2f}" font-size="10" text-anchor="end">{val:.1f}%</text>'
-        )
+        y_ticks = [(y_pos(val), val) for val in np.linspace(0, y_max, 6)]
+        fh.write(_svg_y_grid(y_ticks, margin, width - margin))
 
-    lines.append(
-        f'<text x="{margin}" y="{margin-20}" font-size="12">{y_label}</text>'
-    )
-
-    legend_x = width - margin - 150
-    legend_y = margin
-    for idx, (name, _) in enumerate(series_items):
-        y = legend_y + idx * 20
-        lines.append(
-            f'<rect x="{legend_x}" y="{y-10}" width="12" height="12" fill="{colors[idx % len(colors)]}"/>'
-        )
-        lines.append(
-            f'<text x="{legend_x+18}" y="{y}" font-size="12" alignment-baseline="middle">{name}</text>'
+        fh.write(
+            f'<text x="{margin}" y="{margin-20}" font-size="12">{y_label}</text>\n'
         )
 
-    lines.append("</svg>")
-    path.write_text("\n".join(lines))
+        legend_x = width - margin - 150
+        legend_y = margin
+        for idx, (name, _) in enumerate(series_items):
+            y = legend_y + idx * 20
+            fh.write(
+                f'<rect x="{legend_x}" y="{y-10}" width="12" height="12" fill="{colors[idx % len(colors)]}"/>\n'
+            )
+            fh.write(
+                f'<text x="{legend_x+18}" y="{y}" font-size="12" alignment-baseline="middle">{name}</text>\n'
+            )
+
+        fh.write("</svg>\n")
 
 
-def _svg_deviation_chart(path: Path, title: str, deviations: dict[int, float]):
+def _svg_deviation_chart(path: Path, title: str, deviations: np.ndarray):
     width, height = 900, 500
     margin = 60
     chart_width = width - 2 * margin
     chart_height = height - 2 * margin
 
     digits = list(range(1, 10))
-    max_dev = max(abs(v) for v in deviations.values())
+    max_dev = float(np.abs(deviations).max())
     y_max = max_dev * 1.2 if max_dev else 0.05
 
     def y_pos(value: float) -> float:
         return height - margin - ((value + y_max) / (2 * y_max)) * chart_height
 
-    lines = [
-        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}">',
-        f'<rect width="100%" height="100%" fill="#ffffff"/>',
-        f'<text x="{width/2}" y="30" font-size="18" text-anchor="middle">{title}</text>',
-        f'<line x1="{margin}" y1="{height-margin}" x2="{width-margin}" y2="{height-margin}" stroke="#333"/>',
-        f'<line x1="{margin}" y1="{margin}" x2="{margin}" y2="{height-margin}" stroke="#333"/>',
-    ]
-
     group_width = chart_width / len(digits)
     bar_width = group_width * 0.6
 
-    for idx, digit in enumerate(digits):
-        dev = deviations[digit]
-        x = margin + idx * group_width + (group_width - bar_width) / 2
-        y = y_pos(max(dev, 0))
-        bar_height = abs(dev) / (2 * y_max) * chart_height
-        fill = "#54a24b" if dev >= 0 else "#e45756"
-        lines.append(
-            f'<rect x="{x:.2f}" y="{y:.2f}" width="{bar_width:.2f}" height="{bar_height:.2f}" fill="{fill}"/>'
-        )
-        lines.append(
-            f'<text x="{x + bar_width/2:.2f}" y="{height-margin+20}" font-size="12" text-anchor="middle">{digit}</text>'
+    with path.open("w", encoding="utf-8", buffering=1 << 16) as fh:
+        fh.write(_svg_open(width, height, margin, title))
+
+        for idx in range(len(digits)):
+            dev = float(deviations[idx])
+            x = round(margin + idx * group_width + (group_width - bar_width) / 2)
+            y = round(y_pos(max(dev, 0)))
+            bar_height = round(y_pos(min(dev, 0))) - y
+            fill = "#54a24b" if dev >= 0 else "#e45756"
+            fh.write(
+                f'<rect x="{x}" y="{y}" width="{round(bar_width)}" height="{bar_height}" fill="{fill}"/>\n'
+            )
+        fh.write(
+            _svg_digit_labels(
+                [margin + (idx + 0.5) * group_width for idx in range(len(digits))],
+                height - margin + 20,
+            )
         )
 
-    for i in range(5):
-        val = y_max * (i - 2) / 2
-        y = y_pos(val)
-        lines.append(
-            f'<line x1="{margin}" y1="{y:.2f}" x2="{width-margin}" y2="{y:.2f}" stroke="#ddd"/>'
-        )
-        lines.append(
-            f'<text x="{margin-10}" y="{y+4:.2f}" font-size="10" text-anchor="end">{val:.1f}%</text>'
-        )
+        y_ticks = [(y_pos(val), val) for val in np.linspace(-y_max, y_max, 5)]
+        fh.write(_svg_y_grid(y_ticks, margin, width - margin))
 
-    lines.append(
-        f'<text x="{margin}" y="{margin-20}" font-size="12">Observed - Expected</text>'
-    )
-    lines.append("</svg>")
-    path.write_text("\n".join(lines))
+        fh.write(
+            f'<text x="{margin}" y="{margin-20}" font-size="12">Observed - Expected</text>\n'
+        )
+        fh.write("</svg>\n")
 
 
 def _write_report(result: BenfordResult):
@@ -289,12 +456,12 @@ def _write_report(result: BenfordResult):
         "| Digit | Observed Count | Observed % | Expected % | Deviation (Obs - Exp) |",
         "| --- | --- | --- | --- | --- |",
     ]
-    for digit in range(1, 10):
-        obs_pct = result.observed_pct[digit] * 100
-        exp_pct = result.expected_pct[digit] * 100
+    for idx, digit in enumerate(range(1, 10)):
+        obs_pct = result.observed_pct[idx] * 100
+        exp_pct = result.expected_pct[idx] * 100
         dev = obs_pct - exp_pct
         lines.append(
-            f"| {digit} | {result.counts[digit]:,} | {obs_pct:.2f}% | {exp_pct:.2f}% | {dev:+.2f}% |"
+            f"| {digit} | {int(result.counts[idx]):,} | {obs_pct:.2f}% | {exp_pct:.2f}% | {dev:+.2f}% |"
         )
     lines.extend(
         [
@@ -314,22 +481,22 @@ def _write_report(result: BenfordResult):
 
 def main():
     OUTPUT_DIR.mkdir(exist_ok=True)
-    values = _read_amounts()
-    result = analyze_first_digits(values)
+    counts = _stream_amounts_into_counts()
+    result = _benford_result(counts)
 
     _write_report(result)
 
-    observed_pct = {k: v * 100 for k, v in result.observed_pct.items()}
-    expected_pct = {k: v * 100 for k, v in result.expected_pct.items()}
+    observed_pct = result.observed_pct * 100
+    expected_pct = result.expected_pct * 100
     _svg_bar_chart(
         OBS_VS_EXP_SVG,
         "First-Digit Distribution (Observed vs Expected)",
         {"Observed": observed_pct, "Expected": expected_pct},
         "Percent of totals",
-        max(max(observed_pct.values()), max(expected_pct.values())) * 1.2,
+        float(max(observed_pct.max(), expected_pct.max())) * 1.2,
     )
 
-    deviations = {k: observed_pct[k] - expected_pct[k] for k in observed_pct}
+    deviations = observed_pct - expected_pct
     _svg_deviation_chart(
         DEVIATION_SVG,
         "Deviation from Benford (Observed - Expected)",